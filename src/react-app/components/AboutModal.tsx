@@ -13,6 +13,7 @@ export default function AboutModal({ onClose }: AboutModalProps) {
         <div className="relative p-6 flex flex-col items-center text-center">
           <button
             onClick={onClose}
+            aria-label="Close"
             className="absolute top-4 right-4 p-1 text-zinc-400 hover:text-white transition-colors"
           >
             <X className="w-5 h-5" />
@@ -0,0 +1,262 @@
+"""Shared Chromium instance for the verification scripts.
+
+The first script to enter shared_browser() starts Chromium with remote
+debugging enabled; every other script attaches to it over CDP and opens its
+own BrowserContext. A holders file records the PID of every attached script
+so the browser is only stopped when the last live one exits; entries left
+behind by scripts that were killed outright are dropped.
+"""
+import json
+import os
+import signal
+import subprocess
+import tempfile
+import time
+import urllib.request
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+import _env  # noqa: F401
+from _fast import LAUNCH_ARGS
+
+DEBUG_PORT = 9222
+STATE_DIR = os.path.join(tempfile.gettempdir(), "xit-verify")
+PROFILE_DIR = os.path.join(STATE_DIR, "profile")
+WS_FILE = os.path.join(STATE_DIR, "ws")
+PID_FILE = os.path.join(STATE_DIR, "pid")
+HOLDERS_FILE = os.path.join(STATE_DIR, "holders")
+LOCK_FILE = os.path.join(STATE_DIR, "lock")
+LOG_FILE = os.path.join(STATE_DIR, "chromium.log")
+
+# Chromium processes started by this process, so they can be reaped on stop
+_children = {}
+
+
+@contextmanager
+def _locked():
+    os.makedirs(STATE_DIR, exist_ok=True)
+    with open(LOCK_FILE, "a+") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        else:
+            lock.seek(0)
+            while True:
+                try:
+                    # LK_LOCK gives up after ~10s, so keep retrying
+                    msvcrt.locking(lock.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    pass
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+            else:
+                lock.seek(0)
+                msvcrt.locking(lock.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _read_int(path):
+    try:
+        with open(path) as f:
+            return int(f.read().strip() or 0)
+    except (OSError, ValueError):
+        return 0
+
+
+def _write(path, value):
+    with open(path, "w") as f:
+        f.write(str(value))
+
+
+def _read_holders():
+    try:
+        with open(HOLDERS_FILE) as f:
+            return [int(line) for line in f if line.strip()]
+    except (OSError, ValueError):
+        return []
+
+
+def _write_holders(holders):
+    _write(HOLDERS_FILE, "".join(f"{pid}\n" for pid in holders))
+
+
+def _is_running(pid):
+    if pid <= 0:
+        return False
+    if os.name == "nt":
+        # os.kill() terminates the process on Windows, so ask the kernel instead
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            return False
+        exit_code = ctypes.c_ulong()
+        ok = kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code))
+        kernel32.CloseHandle(handle)
+        return bool(ok) and exit_code.value == 259  # STILL_ACTIVE
+    try:
+        os.kill(pid, 0)
+    except OSError:
+        return False
+    # A process that has exited but not been reaped yet still answers kill(0)
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except (OSError, IndexError):
+        return True
+
+
+def _is_our_browser(pid):
+    """Whether pid is still the Chromium we started, not a process reusing its PID."""
+    proc = _children.get(pid)
+    if proc is not None:
+        return proc.poll() is None
+    if not _is_running(pid):
+        return False
+    try:
+        with open(f"/proc/{pid}/cmdline", "rb") as f:
+            return PROFILE_DIR.encode() in f.read()
+    except OSError:
+        pass
+    # No /proc (macOS, Windows): only trust the PID while the endpoint we
+    # recorded for it is still being served
+    try:
+        with open(WS_FILE) as f:
+            recorded = f.read()
+    except OSError:
+        return False
+    return bool(recorded) and _endpoint() == recorded
+
+
+def _signal(pid, sig):
+    try:
+        os.kill(pid, sig)
+    except OSError:
+        pass
+
+
+def _endpoint():
+    url = f"http://127.0.0.1:{DEBUG_PORT}/json/version"
+    try:
+        with urllib.request.urlopen(url, timeout=1) as resp:
+            return json.load(resp)["webSocketDebuggerUrl"]
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def _chromium_log():
+    try:
+        with open(LOG_FILE, errors="replace") as f:
+            return f.read()[-2000:]
+    except OSError:
+        return ""
+
+
+def _wait_for_ws_endpoint(proc, timeout=15):
+    deadline = time.monotonic() + timeout
+    while True:
+        ws_endpoint = _endpoint()
+        if ws_endpoint:
+            return ws_endpoint
+        if proc.poll() is not None:
+            raise RuntimeError(
+                f"Chromium exited with code {proc.returncode} before exposing a CDP endpoint:\n{_chromium_log()}"
+            )
+        if time.monotonic() > deadline:
+            _stop(proc.pid)
+            raise RuntimeError(
+                f"Chromium did not expose a CDP endpoint on port {DEBUG_PORT}:\n{_chromium_log()}"
+            )
+        time.sleep(0.1)
+
+
+def _start(executable_path):
+    if not os.path.exists(executable_path):
+        raise RuntimeError(
+            f"Chromium not found at {executable_path}; install it with:\n    {_env.INSTALL_COMMAND}"
+        )
+    if _endpoint():
+        raise RuntimeError(
+            f"Port {DEBUG_PORT} is already serving a CDP endpoint that this script didn't start; "
+            "close that browser before running the verifications"
+        )
+    with open(LOG_FILE, "wb") as log:
+        proc = subprocess.Popen(
+            [
+                executable_path,
+                *LAUNCH_ARGS,
+                f"--remote-debugging-port={DEBUG_PORT}",
+                f"--user-data-dir={PROFILE_DIR}",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=log,
+        )
+    _children[proc.pid] = proc
+    _write(PID_FILE, proc.pid)
+    _write(WS_FILE, _wait_for_ws_endpoint(proc))
+
+
+def _stop(pid, timeout=10):
+    """Terminate Chromium and wait until it has actually exited."""
+    if _is_our_browser(pid):
+        _signal(pid, signal.SIGTERM)
+        deadline = time.monotonic() + timeout
+        while _is_running(pid):
+            if time.monotonic() > deadline:
+                _signal(pid, getattr(signal, "SIGKILL", signal.SIGTERM))
+                deadline = time.monotonic() + timeout
+            proc = _children.get(pid)
+            if proc is not None:
+                proc.poll()
+            time.sleep(0.05)
+    proc = _children.pop(pid, None)
+    if proc is not None:
+        proc.wait()
+    for path in (PID_FILE, WS_FILE):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def _acquire(executable_path):
+    with _locked():
+        holders = [pid for pid in _read_holders() if _is_running(pid)]
+        pid = _read_int(PID_FILE)
+        if not holders or not _is_our_browser(pid):
+            # Either nobody is attached (any browser left over belongs to
+            # holders that died) or the browser itself has gone away
+            _stop(pid)
+            _start(executable_path)
+        _write_holders(holders + [os.getpid()])
+        with open(WS_FILE) as f:
+            return f.read()
+
+
+def _release():
+    with _locked():
+        holders = [pid for pid in _read_holders() if _is_running(pid)]
+        if os.getpid() in holders:
+            holders.remove(os.getpid())
+        _write_holders(holders)
+        if not holders:
+            _stop(_read_int(PID_FILE))
+
+
+@contextmanager
+def shared_browser(executable_path):
+    """Yield the CDP websocket endpoint of the shared verification Chromium.
+
+    Pass p.chromium.executable_path so the Playwright-managed build is used,
+    then attach with p.chromium.connect_over_cdp(ws_endpoint).
+    """
+    ws_endpoint = _acquire(executable_path)
+    try:
+        yield ws_endpoint
+    finally:
+        _release()
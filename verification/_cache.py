@@ -0,0 +1,146 @@
+"""Reuse verification screenshots when the served app hasn't changed.
+
+A script calls restore_cached() before doing any Playwright work; if neither
+the app nor the verification code (the script itself and the _*.py helpers)
+has changed since a previous successful run, the cached outputs are copied
+into place and the script can return early. After a successful run,
+store_cached() saves the outputs under the current fingerprint.
+"""
+import functools
+import hashlib
+import json
+import os
+import re
+import shutil
+import urllib.request
+from urllib.parse import urljoin, urlparse
+
+from _fast import ensure_output_dir
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+VERIFICATION_DIR = os.path.join(ROOT, "verification")
+CACHE_DIR = os.path.join(VERIFICATION_DIR, ".cache")
+ASSET_RE = re.compile(r'<(?:script|link)\b[^>]*\b(?:src|href)="([^"]+)"')
+
+
+# Build inputs hashed as-is alongside src/
+CONFIG_FILES = ["index.html", "vite.config.ts", "tailwind.config.js", "postcss.config.js"]
+
+
+def _package_inputs():
+    """The parts of package.json and package-lock.json that affect the build.
+
+    The version fields are left out: every commit bumps them, and they never
+    change what the app renders.
+    """
+    with open(os.path.join(ROOT, "package.json")) as f:
+        package = json.load(f)
+    with open(os.path.join(ROOT, "package-lock.json")) as f:
+        lock = json.load(f)
+    lock.pop("version", None)
+    lock.get("packages", {}).get("", {}).pop("version", None)
+    return json.dumps(
+        {
+            "dependencies": package.get("dependencies", {}),
+            "devDependencies": package.get("devDependencies", {}),
+            "lock": lock,
+        },
+        sort_keys=True,
+    ).encode()
+
+
+@functools.lru_cache(maxsize=None)
+def source_fingerprint():
+    digest = hashlib.sha1()
+    digest.update(_package_inputs())
+    paths = [os.path.join(ROOT, name) for name in CONFIG_FILES]
+    for dirpath, dirnames, filenames in os.walk(os.path.join(ROOT, "src")):
+        dirnames.sort()
+        paths.extend(os.path.join(dirpath, name) for name in sorted(filenames))
+    for path in paths:
+        digest.update(os.path.relpath(path, ROOT).encode())
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _fetch(url):
+    with urllib.request.urlopen(url, timeout=5) as resp:
+        return resp.read()
+
+
+@functools.lru_cache(maxsize=None)
+def spa_fingerprint(url="http://localhost:5173/"):
+    """Hash the served HTML, its same-origin entry assets and the local sources.
+
+    Returns None if the app can't be reached, which disables caching.
+    """
+    digest = hashlib.sha1()
+    try:
+        html = _fetch(url)
+        digest.update(html)
+        # Hashed chunk names in a production build change the HTML itself, but
+        # the dev server always serves the same entry URLs, so hash the assets
+        # too, plus the sources behind them for modules the entry imports.
+        for src in ASSET_RE.findall(html.decode("utf-8", "replace")):
+            asset_url = urljoin(url, src)
+            if urlparse(asset_url).netloc == urlparse(url).netloc:
+                digest.update(_fetch(asset_url))
+    except OSError:
+        return None
+    digest.update(source_fingerprint().encode())
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def code_fingerprint(script):
+    """Hash verification/<script>.py and the shared _*.py helpers it runs on."""
+    digest = hashlib.sha1()
+    helpers = sorted(name for name in os.listdir(VERIFICATION_DIR) if name.startswith("_") and name.endswith(".py"))
+    for name in [f"{script}.py", *helpers]:
+        digest.update(name.encode())
+        with open(os.path.join(VERIFICATION_DIR, name), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _fingerprint(script, url):
+    app = spa_fingerprint(url)
+    if app is None:
+        return None
+    return hashlib.sha1(f"{app}:{code_fingerprint(script)}".encode()).hexdigest()
+
+
+def _cached_path(script, fingerprint, path):
+    return os.path.join(CACHE_DIR, script, fingerprint, os.path.basename(path))
+
+
+def restore_cached(script, paths, url="http://localhost:5173/"):
+    """Copy cached outputs for script into place; return True if all were found.
+
+    script is the calling module's name (e.g. "verify_ui"), which is also
+    how its source is found for the fingerprint.
+    """
+    fingerprint = _fingerprint(script, url)
+    if fingerprint is None:
+        return False
+    cached = [_cached_path(script, fingerprint, path) for path in paths]
+    if not all(os.path.exists(c) for c in cached):
+        return False
+    for src, dst in zip(cached, paths):
+        ensure_output_dir(dst)
+        shutil.copyfile(src, dst)
+    print(f"App and {script} unchanged since last run, reused cached output")
+    return True
+
+
+def store_cached(script, paths, url="http://localhost:5173/"):
+    """Save the outputs of a successful run under the current fingerprint."""
+    fingerprint = _fingerprint(script, url)
+    if fingerprint is None:
+        return
+    for path in paths:
+        if os.path.exists(path):
+            cached = _cached_path(script, fingerprint, path)
+            ensure_output_dir(cached)
+            shutil.copyfile(path, cached)
@@ -0,0 +1,31 @@
+"""Environment shared by the verification scripts.
+
+Imported for its side effect. Pins Playwright's browser cache to one
+per-user directory so every script (and every CI run restoring that
+directory) reuses the same downloaded Chromium instead of fetching it
+again. Warm it once with:
+
+    PLAYWRIGHT_BROWSERS_PATH=~/.cache/xit-playwright python -m playwright install chromium
+
+Until that directory has been populated, Playwright's default location
+(where a plain `playwright install chromium` puts browsers) is used
+instead. Playwright reads this when its driver starts, so it only has to
+be set before sync_playwright() is entered.
+"""
+import os
+
+PINNED_BROWSERS_PATH = os.path.expanduser("~/.cache/xit-playwright")
+INSTALL_COMMAND = f"PLAYWRIGHT_BROWSERS_PATH={PINNED_BROWSERS_PATH} python -m playwright install chromium"
+
+
+def _has_chromium(path):
+    # Playwright's driver creates the directory (and a .links entry) on its
+    # own, so look for an installed Chromium build rather than any content
+    try:
+        return any(name.startswith("chromium") for name in os.listdir(path))
+    except OSError:
+        return False
+
+
+if _has_chromium(PINNED_BROWSERS_PATH):
+    os.environ.setdefault("PLAYWRIGHT_BROWSERS_PATH", PINNED_BROWSERS_PATH)
@@ -0,0 +1,76 @@
+"""Helpers that trim work the verification scripts don't need."""
+import json
+import pathlib
+from urllib.parse import urlparse
+
+# Chromium flags for the shared verification browser: new headless mode,
+# no GPU, and none of the background services a CI container doesn't need.
+LAUNCH_ARGS = [
+    "--headless=new",
+    "--disable-gpu",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--metrics-recording-only",
+    "--mute-audio",
+]
+
+# Third-party hosts the app pulls from at load time. The caption fonts from
+# Google Fonts are render-blocking and never matter for these checks.
+BLOCKED_HOSTS = {"fonts.googleapis.com", "fonts.gstatic.com"}
+
+
+def install_fast_routes(context, keep_images=False):
+    """Abort requests for images, media, fonts and third-party hosts.
+
+    Pass keep_images=True when a check asserts on an <img>. Stylesheets
+    are always let through: every script's output is a screenshot someone
+    looks at, and the checks rely on classes like `hidden`. Works with both
+    the sync and async Playwright APIs; async callers await the result.
+    """
+    blocked_types = {"image", "media", "font"}
+    if keep_images:
+        blocked_types.discard("image")
+
+    def handle(route):
+        request = route.request
+        if request.resource_type in blocked_types or urlparse(request.url).hostname in BLOCKED_HOSTS:
+            return route.abort()
+        return route.continue_()
+
+    return context.route("**/*", handle)
+
+
+NO_ANIMATIONS_CSS = (
+    "*, *::before, *::after {"
+    " animation-duration: 0s !important;"
+    " transition-duration: 0s !important;"
+    " caret-color: transparent !important; }"
+)
+
+
+def disable_animations(context):
+    """Zero out CSS animations and transitions so menus and modals open instantly.
+
+    Like install_fast_routes(), async callers await the result.
+    """
+    return context.add_init_script(f"""
+        document.addEventListener('DOMContentLoaded', () => {{
+            const style = document.createElement('style');
+            style.textContent = {json.dumps(NO_ANIMATIONS_CSS)};
+            document.head.appendChild(style);
+        }});
+    """)
+
+
+def ensure_output_dir(path):
+    """Create the parent directory of an output file, if it doesn't exist yet.
+
+    Playwright already does this for screenshot(path=...), so this is only
+    needed when writing outputs some other way.
+    """
+    pathlib.Path(path).parent.mkdir(parents=True, exist_ok=True)
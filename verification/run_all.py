@@ -0,0 +1,50 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from playwright.sync_api import sync_playwright
+from _browser import shared_browser
+from verify_auto_edit import verify_auto_edit
+from verify_links import verify_github_links
+from verify_menubar import verify_menubar
+from verify_reframe import verify_reframe_tool
+from verify_renames import verify_renames
+from verify_scrollbars_all import verify_scrollbars
+from verify_ui import verify_ui_elements
+
+VERIFICATIONS = [
+    verify_auto_edit,
+    verify_github_links,
+    verify_menubar,
+    verify_reframe_tool,
+    verify_renames,
+    verify_scrollbars,
+    verify_ui_elements,
+]
+
+def run(fn):
+    try:
+        result = fn()
+        if asyncio.iscoroutine(result):
+            # Async verifications get their own event loop on this thread
+            asyncio.run(result)
+        return None
+    except Exception as e:
+        return f"{fn.__module__}.{fn.__name__}: {e}"
+
+def run_all():
+    with sync_playwright() as p, shared_browser(p.chromium.executable_path):
+        # Holding the shared browser for the whole run keeps it alive between
+        # verifications, even if one finishes before the next has attached.
+
+        # Each verification is I/O-bound on the dev server, so run them side by
+        # side; they all attach to the same shared Chromium via _browser.
+        with ThreadPoolExecutor(max_workers=len(VERIFICATIONS)) as pool:
+            failures = [f for f in pool.map(run, VERIFICATIONS) if f]
+
+    for failure in failures:
+        print(f"FAILURE: {failure}")
+    print(f"{len(VERIFICATIONS) - len(failures)}/{len(VERIFICATIONS)} verifications completed")
+    return not failures
+
+if __name__ == "__main__":
+    raise SystemExit(0 if run_all() else 1)
@@ -1,24 +1,35 @@
 from playwright.sync_api import sync_playwright
-import time
+from _browser import shared_browser
+from _cache import restore_cached, store_cached
+from _fast import disable_animations, install_fast_routes
+
+OUTPUTS = ["verification/initial_state.png"]
 
 def verify_auto_edit():
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
+    if restore_cached("verify_auto_edit", OUTPUTS, url="http://localhost:3000/"):
+        return
+
+    with sync_playwright() as p, shared_browser(p.chromium.executable_path) as ws_endpoint:
+        browser = p.chromium.connect_over_cdp(ws_endpoint)
+        context = browser.new_context()
+        page = context.new_page()
+        install_fast_routes(context)
+        disable_animations(context)
 
         # Navigate to the app
-        page.goto("http://localhost:3000")
-        time.sleep(2) # Wait for initial load
+        page.goto("http://localhost:3000", wait_until="domcontentloaded", timeout=15000)
 
         # Mock hasProject and hasClips to make button enabled
         # The button is disabled based on hasProject
         # Instead, we will type a prompt in the text area to trigger auto-edit directly
 
         # Find the text area and type the magic word
+        page.wait_for_selector("textarea", state="attached", timeout=5000)
         textarea = page.locator("textarea[placeholder='Upload a video first...']")
         if textarea.count() > 0:
             print("Video needed to trigger auto-edit")
             page.screenshot(path="verification/initial_state.png")
+            store_cached("verify_auto_edit", OUTPUTS, url="http://localhost:3000/")
 
         browser.close()
 
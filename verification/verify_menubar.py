@@ -1,9 +1,20 @@
-from playwright.sync_api import sync_playwright, expect
+from playwright.sync_api import sync_playwright
+from _browser import shared_browser
+from _cache import restore_cached, store_cached
+from _fast import disable_animations, install_fast_routes
+
+OUTPUTS = ["verification/menubar_icons.jpg"]
 
 def verify_menubar():
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page(viewport={"width": 1280, "height": 800})
+    if restore_cached("verify_menubar", OUTPUTS):
+        return
+
+    with sync_playwright() as p, shared_browser(p.chromium.executable_path) as ws_endpoint:
+        browser = p.chromium.connect_over_cdp(ws_endpoint)
+        context = browser.new_context(viewport={"width": 1280, "height": 800})
+        page = context.new_page()
+        install_fast_routes(context, keep_images=True)
+        disable_animations(context)
 
         # Go to the app
         page.goto("http://localhost:5173")
@@ -13,15 +24,10 @@ def verify_menubar():
 
         # Take a screenshot of the top bar
         menubar = page.locator(".app-region-drag").first
-        menubar.screenshot(path="verification/menubar_icons.png")
-
-        # Also take a full page screenshot
-        page.screenshot(path="verification/full_page.png")
+        menubar.screenshot(path="verification/menubar_icons.jpg", type="jpeg", quality=60)
+        store_cached("verify_menubar", OUTPUTS)
 
         browser.close()
 
 if __name__ == "__main__":
-    import os
-    if not os.path.exists("verification"):
-        os.makedirs("verification")
     verify_menubar()
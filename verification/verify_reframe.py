@@ -1,29 +1,39 @@
 from playwright.sync_api import sync_playwright
-import os
-import time
+from _browser import shared_browser
+from _cache import restore_cached, store_cached
+from _fast import disable_animations, install_fast_routes
+
+OUTPUTS = ["verification/reframe_tool_ui.png"]
 
 def verify_reframe_tool():
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
+    if restore_cached("verify_reframe", OUTPUTS):
+        return
+
+    with sync_playwright() as p, shared_browser(p.chromium.executable_path) as ws_endpoint:
+        browser = p.chromium.connect_over_cdp(ws_endpoint)
+        context = browser.new_context()
+        page = context.new_page()
+        install_fast_routes(context)
+        disable_animations(context)
 
         # 1. Arrange: Go to the app homepage
-        page.goto("http://localhost:5173")
-        page.wait_for_load_state("networkidle")
+        page.goto("http://localhost:5173", wait_until="domcontentloaded", timeout=15000)
+        view_menu = page.get_by_role("button", name="View")
+        view_menu.wait_for(state="visible", timeout=10000)
 
         # 2. Act: Open the "View" menu and verify "Auto-Reframe Tool" exists
         # Note: The MenuBar implementation might not be using standard accessible roles/labels perfectly yet,
         # so we'll look for text if roles fail.
 
         # Click the "View" menu button
-        page.get_by_role("button", name="View").click()
+        view_menu.click()
 
         # Verify the menu item exists
         reframe_menu_item = page.get_by_text("Auto-Reframe Tool")
         if not reframe_menu_item.is_visible():
-            print("Auto-Reframe Tool menu item not visible")
             # Take a screenshot of the menu
             page.screenshot(path="verification/menu_verification.png")
+            raise AssertionError("Auto-Reframe Tool menu item not visible")
         else:
             print("Auto-Reframe Tool menu item found")
             # Click it to toggle the tool (though we might not see it without a selected clip)
@@ -31,6 +41,7 @@ def verify_reframe_tool():
 
         # Take a screenshot of the main UI
         page.screenshot(path="verification/reframe_tool_ui.png")
+        store_cached("verify_reframe", OUTPUTS)
 
         browser.close()
 
@@ -1,10 +1,20 @@
 from playwright.sync_api import sync_playwright
-import time
+from _browser import shared_browser
+from _cache import restore_cached, store_cached
+from _fast import disable_animations, install_fast_routes
+
+OUTPUTS = ["verification_full.jpg", "verification_toolbar.jpg"]
 
 def verify_ui_elements():
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
+    if restore_cached("verify_ui", OUTPUTS):
+        return
+
+    with sync_playwright() as p, shared_browser(p.chromium.executable_path) as ws_endpoint:
+        browser = p.chromium.connect_over_cdp(ws_endpoint)
+        context = browser.new_context()
+        page = context.new_page()
+        install_fast_routes(context)
+        disable_animations(context)
 
         try:
             # Navigate to the app
@@ -14,25 +24,28 @@ def verify_ui_elements():
             # Wait for the page to load and the toolbar to be visible
             # The toolbar has specific icons we can look for
             print("Waiting for toolbar...")
-            page.wait_for_selector("button[title='Cut at playhead (split clip)']", timeout=30000)
+            split_button = page.locator("button[title='Cut at playhead (split clip)']")
+            split_button.wait_for(timeout=30000)
 
             # Take a screenshot of the entire page
             print("Taking full page screenshot...")
-            page.screenshot(path="verification_full.png")
+            page.screenshot(path="verification_full.jpg", type="jpeg", quality=60)
 
             # Take a screenshot of just the toolbar area
             # We'll try to find the container that holds the tools
-            toolbar = page.locator("button[title='Cut at playhead (split clip)']").locator("..").locator("..")
+            toolbar = split_button.locator("..").locator("..")
 
             print("Taking toolbar screenshot...")
-            toolbar.screenshot(path="verification_toolbar.png")
+            toolbar.screenshot(path="verification_toolbar.jpg", type="jpeg", quality=60)
 
+            store_cached("verify_ui", OUTPUTS)
             print("Verification complete!")
 
         except Exception as e:
             print(f"Error during verification: {e}")
             # Take a screenshot even if it fails, to see what happened
             page.screenshot(path="verification_error.png")
+            raise
         finally:
             browser.close()
 